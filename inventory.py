@@ -1,11 +1,30 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import bisect
 import difflib
+import heapq
 import re
 import csv
+import json
 import os
-from typing import Dict, List, Tuple, Optional
+import string
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Optional
+
+try:
+    # Optional: C-accelerated fuzzy matching; difflib is used when missing
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
+try:
+    # Optional: multi-threaded CSV parsing for large catalogs
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = pa_csv = None
 
 # ============================================================
 # Config & data model
@@ -14,72 +33,237 @@ from typing import Dict, List, Tuple, Optional
 # CSV file used as single source of truth
 MANUALS_CSV = "manuals.csv"
 
-# manuals: title -> {"box": "BOX 1|BOX 2|BOX 3|None", "cover": bool}
-manuals: Dict[str, Dict[str, Optional[str] | bool]] = {}
+# Parsed copy of MANUALS_CSV (plain JSON data), reused while the CSV is unchanged
+MANUALS_SNAPSHOT = "manuals.snapshot.json"
 
-# lowercase index: title.lower() -> title
-_lc_index: Dict[str, str] = {}
+# CSVs at least this large are parsed with pyarrow when it is installed;
+# below that its thread start-up costs more than the csv module's parse
+ARROW_MIN_BYTES = 1 << 20
+
+# values of the cover column read as True (case-insensitive)
+TRUE_VALUES = frozenset(("1", "true", "yes", "y", "on"))
+
+# set by init_manuals(); the CLI loads the catalog on its first command
+_loaded = False
+
+# Catalog, stored column-wise: entry i is (_titles[i], _boxes[i], _covers[i])
+#   box: "BOX 1|BOX 2|BOX 3|None", cover: 0/1
+_titles: List[str] = []
+_boxes: List[Optional[str]] = []
+_covers = bytearray()
+
+# display label per entry: its box, else 'COVER' / 'UNKNOWN' (interned)
+_labels: List[str] = []
+
+# listings, kept in title order: label -> indices, and all entries with a cover
+_box_indices: Dict[str, List[int]] = {}
+_cover_indices: List[int] = []
+
+# title -> index, and lowercase index: title.lower() -> index
+_idx_of: Dict[str, int] = {}
+_lc_index: Dict[str, int] = {}
+
+# prefix index: sorted title.lower() keys, with the matching indices alongside
+_lc_keys: List[str] = []
+_lc_order: List[int] = []
+
+# search cache, parallel arrays indexed like _titles (rebuilt with _lc_index)
+_norm_titles: List[str] = []
+# inverted index: token -> indices into _titles containing it
+_postings: Dict[str, Set[int]] = {}
 
 # ============================================================
 # CSV load/save
 # ============================================================
 
-def load_manuals_from_csv(path: str = MANUALS_CSV) -> Dict[str, Dict[str, Optional[str] | bool]]:
-    """Load manuals from a CSV file: columns title,box,cover."""
-    manuals_from_file: Dict[str, Dict[str, Optional[str] | bool]] = {}
-    if not os.path.exists(path):
-        return manuals_from_file
-
-    with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+def _cell(row: List[str], k: Optional[int]) -> str:
+    """Stripped value of column k, or "" when the column or the cell is missing."""
+    return row[k].strip() if k is not None and k < len(row) else ""
+
+def _csv_rows(path: str) -> Iterator[Tuple[str, str, str]]:
+    """Stripped (title, box, cover) cells of each data row, read with the csv module."""
+    # utf-8-sig skips the BOM of Excel's "CSV UTF-8" export, as pyarrow does
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        # columns are located by header name (the last one wins, as with DictReader)
+        col = {name: k for k, name in enumerate(next(reader, []))}
+        t_col, b_col, c_col = col.get("title"), col.get("box"), col.get("cover")
         for row in reader:
-            title = (row.get("title") or "").strip()
-            if not title:
-                continue
-            box_raw = (row.get("box") or "").strip()
-            box = box_raw or None
-            cover_raw = (row.get("cover") or "").strip().lower()
-            cover = cover_raw in ("1", "true", "yes", "y", "on")
-            manuals_from_file[title] = {"box": box, "cover": cover}
-    return manuals_from_file
+            yield _cell(row, t_col), _cell(row, b_col), _cell(row, c_col)
+
+def _arrow_rows(path: str) -> Optional[Iterable[Tuple[str, str, str]]]:
+    """
+    Same cells as _csv_rows, parsed by pyarrow's multi-threaded reader.
+    None when pyarrow rejects the file (e.g. ragged rows, repeated
+    column names), so the caller can fall back to the csv module.
+    """
+    names = ("title", "box", "cover")
+    try:
+        table = pa_csv.read_csv(
+            path,
+            read_options=pa_csv.ReadOptions(use_threads=True),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=dict.fromkeys(names, pa.string()), strings_can_be_null=False),
+        )
+        if any(table.column_names.count(name) > 1 for name in names):
+            return None
+    except (pa.ArrowInvalid, OSError):
+        return None
+
+    def column(name: str) -> List[str]:
+        if name not in table.column_names:
+            return [""] * table.num_rows
+        return [v.strip() for v in table.column(name).to_pylist()]
+
+    return zip(*(column(name) for name in names))
+
+def load_manuals_from_csv(path: str = MANUALS_CSV) -> Tuple[List[str], List[Optional[str]], bytearray]:
+    """
+    Load manuals from a CSV file: columns title,box,cover.
+    Returns parallel (titles, boxes, covers) columns; a repeated title
+    keeps its first position and takes the values of its last row.
+    """
+    titles: List[str] = []
+    boxes: List[Optional[str]] = []
+    covers = bytearray()
+    idx_of: Dict[str, int] = {}
+    if not os.path.exists(path):
+        return titles, boxes, covers
+
+    rows = None
+    if pa_csv is not None and os.path.getsize(path) >= ARROW_MIN_BYTES:
+        rows = _arrow_rows(path)
+    if rows is None:
+        rows = _csv_rows(path)
+    for title, box_raw, cover_raw in rows:
+        if not title:
+            continue
+        box = box_raw or None
+        cover = cover_raw.lower() in TRUE_VALUES
+        i = idx_of.get(title)
+        if i is None:
+            idx_of[title] = len(titles)
+            titles.append(title)
+            boxes.append(box)
+            covers.append(cover)
+        else:
+            boxes[i] = box
+            covers[i] = cover
+    return titles, boxes, covers
 
 def save_manuals_to_csv(path: str = MANUALS_CSV) -> None:
-    """Save the current manuals dict to CSV."""
+    """Save the current catalog to CSV."""
     with open(path, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(["title", "box", "cover"])
-        for title in sorted(manuals.keys(), key=str.lower):
-            meta = manuals[title]
-            box = meta.get("box") or ""
-            cover = "1" if meta.get("cover") else "0"
-            writer.writerow([title, box, cover])
+        for i in sorted(range(len(_titles)), key=lambda i: _titles[i].lower()):
+            writer.writerow([_titles[i], _boxes[i] or "", "1" if _covers[i] else "0"])
+
+def csv_stamp(csv_path: str = MANUALS_CSV) -> Optional[List[int]]:
+    """[mtime_ns, size] identifying the current version of the CSV, or None if it is missing."""
+    try:
+        st = os.stat(csv_path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+def load_snapshot(stamp: List[int], path: str = MANUALS_SNAPSHOT) -> Optional[Tuple[List[str], List[Optional[str]], bytearray]]:
+    """
+    (titles, boxes, covers) from the snapshot, or None if there is none,
+    it is malformed, or it was taken from another version of the CSV.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data["stamp"] != stamp:
+            return None
+        titles, boxes, covers = data["titles"], data["boxes"], data["covers"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not (isinstance(titles, list) and isinstance(boxes, list) and isinstance(covers, list)
+            and len(titles) == len(boxes) == len(covers)
+            and all(isinstance(t, str) for t in titles)
+            and all(b is None or isinstance(b, str) for b in boxes)
+            and all(type(c) is int and c in (0, 1) for c in covers)):
+        return None
+    return titles, boxes, bytearray(covers)
+
+def save_snapshot(columns: Tuple[List[str], List[Optional[str]], bytearray],
+                  stamp: List[int], path: str = MANUALS_SNAPSHOT) -> None:
+    """
+    Write parsed columns to the snapshot; best effort. stamp must be taken
+    before the CSV was parsed, so an edit made meanwhile makes it stale.
+    """
+    titles, boxes, covers = columns
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"stamp": stamp, "titles": titles, "boxes": boxes, "covers": list(covers)}, f)
+    except OSError:
+        pass
+
+def rec(i: int) -> Dict[str, Optional[str] | bool]:
+    """Entry i as the {"box": ..., "cover": ...} dict the CLI prints."""
+    return {"box": _boxes[i], "cover": bool(_covers[i])}
 
 def rebuild_lc_index() -> None:
-    global _lc_index
-    _lc_index = {title.lower(): title for title in manuals.keys()}
+    global _idx_of, _lc_index, _lc_keys, _lc_order, _norm_titles, _postings
+    _idx_of = {title: i for i, title in enumerate(_titles)}
+    _lc_index = {title.lower(): i for i, title in enumerate(_titles)}
+    _lc_order = sorted(range(len(_titles)), key=lambda i: _titles[i].lower())
+    _lc_keys = [_titles[i].lower() for i in _lc_order]
+    _norm_titles = [normalize(title) for title in _titles]
+    _postings = {}
+    for i, title in enumerate(_titles):
+        for tok in tokens(title):
+            _postings.setdefault(tok, set()).add(i)
+    _rebuild_group_indices()
+    # cached results hold indices into the old arrays
+    _smart_search_cached.cache_clear()
+
+def _rebuild_group_indices() -> None:
+    """Labels and pre-sorted listing indices; walks _lc_order, so run after it is rebuilt."""
+    global _labels, _box_indices, _cover_indices
+    _labels = [sys.intern(box or ("COVER" if _covers[i] else "UNKNOWN")) for i, box in enumerate(_boxes)]
+    _box_indices = {}
+    for i in _lc_order:
+        _box_indices.setdefault(_labels[i], []).append(i)
+    _cover_indices = [i for i in _lc_order if _covers[i]]
 
 def init_manuals() -> None:
     """
-    Load manuals from CSV if it exists, otherwise:
+    Load manuals from CSV if it exists (via the snapshot while the CSV is
+    unchanged), otherwise:
       - create an empty manuals.csv
       - start with an empty catalog
     """
-    global manuals
-    from_csv = load_manuals_from_csv(MANUALS_CSV)
-    if from_csv:
-        manuals = from_csv
-    else:
-        manuals = {}
+    global _titles, _boxes, _covers, _loaded
+    stamp = csv_stamp(MANUALS_CSV)
+    columns = load_snapshot(stamp) if stamp else None
+    if columns is None:
+        columns = load_manuals_from_csv(MANUALS_CSV)
+        if columns[0] and stamp:
+            save_snapshot(columns, stamp)
+    _titles, _boxes, _covers = columns
+    if not _titles:
         # create an empty CSV with header so you can edit it in Excel/LibreOffice
         save_manuals_to_csv(MANUALS_CSV)
         print(f"Created empty {MANUALS_CSV}. Add rows (title, box, cover) and rerun.")
     rebuild_lc_index()
+    _loaded = True
+
+def _ensure_loaded() -> None:
+    """Run init_manuals() unless the catalog has already been loaded."""
+    if not _loaded:
+        init_manuals()
 
 def remove_manual_by_title(title: str) -> bool:
     """Remove a manual by its exact stored title and persist to CSV."""
-    global manuals
-    if title in manuals:
-        del manuals[title]
+    i = _idx_of.get(title)
+    if i is not None:
+        del _titles[i]
+        del _boxes[i]
+        del _covers[i]
         rebuild_lc_index()
         save_manuals_to_csv(MANUALS_CSV)
         return True
@@ -91,80 +275,174 @@ def remove_manual_by_title(title: str) -> bool:
 
 _word_re = re.compile(r"[a-z0-9]+")
 
+# ASCII fast path for _word_re: every byte outside [a-z0-9] becomes a space
+_WORD_BYTES = frozenset((string.ascii_lowercase + string.digits).encode())
+_SEP_TABLE = bytes(b if b in _WORD_BYTES else 0x20 for b in range(256))
+
 def normalize(s: str) -> str:
-    return " ".join(_word_re.findall(s.lower()))
+    return " ".join(tokens(s))
 
 def tokens(s: str) -> List[str]:
-    return _word_re.findall(s.lower())
+    s = s.lower()
+    if s.isascii():
+        return s.encode("ascii").translate(_SEP_TABLE).decode("ascii").split()
+    return _word_re.findall(s)
 
-def token_overlap_score(q_tokens: List[str], c_tokens: List[str]) -> float:
-    if not q_tokens:
+def token_marks(q_tokens: Iterable[str]) -> Dict[int, int]:
+    """
+    Title index -> bitset of the query tokens it contains (bit j for the
+    j-th token of q_tokens), built term-at-a-time from _postings. Titles
+    sharing no token with the query are absent.
+    """
+    marks: Dict[int, int] = {}
+    for j, tok in enumerate(q_tokens):
+        bit = 1 << j
+        for i in _postings.get(tok, ()):
+            marks[i] = marks.get(i, 0) | bit
+    return marks
+
+def token_overlap_score(q_count: int, c_marks: int) -> float:
+    """Share of the q_count distinct query tokens set in the candidate's marks."""
+    if not q_count:
         return 0.0
-    qset, cset = set(q_tokens), set(c_tokens)
-    overlap = len(qset & cset)
-    return overlap / max(1, len(qset))
+    return c_marks.bit_count() / q_count
+
+def sequence_ratio(a: str, b: str, score_cutoff: float = 0.0) -> float:
+    """Similarity of a and b in [0, 1]; ratios below score_cutoff come back as 0.0."""
+    if fuzz is not None:
+        return fuzz.ratio(a, b, score_cutoff=100.0 * score_cutoff) / 100.0
+    sm = difflib.SequenceMatcher(None, a, b)
+    # cheap upper bounds first: skip the full match when they already miss
+    if sm.real_quick_ratio() < score_cutoff or sm.quick_ratio() < score_cutoff:
+        return 0.0
+    r = sm.ratio()
+    return r if r >= score_cutoff else 0.0
 
-def partial_window_ratio(query: str, candidate: str, max_window_words: int = 8) -> float:
-    q = normalize(query)
-    c = normalize(candidate)
+def partial_window_ratio(q: str, c: str, max_window_words: int = 8, score_cutoff: float = 0.0) -> float:
+    """
+    Best match of normalized query q against a window of normalized candidate c.
+    Scores below score_cutoff come back as 0.0.
+    """
     q_tokens = q.split()
     c_tokens = c.split()
     if not q_tokens or not c_tokens:
         return 0.0
     if q in c:
         return 1.0
+    if fuzz is not None:
+        # best-aligned substring of c, computed in a single C call
+        return fuzz.partial_ratio(q, c, score_cutoff=100.0 * score_cutoff) / 100.0
     w = min(max(len(q_tokens), 1), max_window_words)
     best = 0.0
     for i in range(0, len(c_tokens)):
         window = " ".join(c_tokens[i:i + w])
         if not window:
             continue
-        r = difflib.SequenceMatcher(None, q, window).ratio()
+        # windows that can't beat the best so far are rejected by their upper bound
+        r = sequence_ratio(q, window, max(best, score_cutoff))
         if r > best:
             best = r
     return best
 
-def composite_score(query: str, candidate: str) -> float:
-    q_norm = normalize(query)
-    c_norm = normalize(candidate)
-    sub = 1.0 if q_norm and q_norm in c_norm else 0.0
-    tok = token_overlap_score(tokens(query), tokens(candidate))
-    glob = difflib.SequenceMatcher(None, q_norm, c_norm).ratio()
-    part = partial_window_ratio(query, candidate)
-    return max(sub, part, 0.85 * tok, 0.75 * glob)
+def composite_score(q_norm: str, q_count: int, c_norm: str, c_marks: int,
+                    min_score: float = 0.0) -> float:
+    """
+    Score a precomputed query against a precomputed candidate: normalized
+    text, the query's distinct token count and the candidate's token_marks.
+    Exact for scores >= min_score; lower scores may be under-reported.
+    """
+    if not q_norm:
+        return 0.0
+    if q_norm in c_norm:
+        return 1.0
+    best = max(partial_window_ratio(q_norm, c_norm, score_cutoff=min_score),
+               0.85 * token_overlap_score(q_count, c_marks))
+    # the global ratio is weighted 0.75, so it can only win below that
+    if best >= 0.75 or min_score > 0.75:
+        return best
+    return max(best, 0.75 * sequence_ratio(q_norm, c_norm, min_score / 0.75))
+
+def batch_scores(q_norm: str, q_count: int, marks: Dict[int, int], candidates: List[int],
+                 min_score: float) -> Dict[int, float]:
+    """
+    composite_score for many candidates at once (requires rapidfuzz).
+    Each fuzzy scorer runs as a single rapidfuzz call over all candidate
+    titles; only indices scoring >= min_score are returned.
+    """
+    scores: Dict[int, float] = {}
+    for i in candidates:
+        sub = 1.0 if q_norm and q_norm in _norm_titles[i] else 0.0
+        s = max(sub, 0.85 * token_overlap_score(q_count, marks.get(i, 0)))
+        if s >= min_score:
+            scores[i] = s
+    # max() passes min_score iff one term does, so each scorer gets its own cutoff
+    for scorer, weight in ((fuzz.partial_ratio, 1.0), (fuzz.ratio, 0.75)):
+        cutoff = 100.0 * min_score / weight
+        if cutoff > 100.0:
+            continue
+        # a scorer weighted w can't raise a score that already reaches w
+        pending = [i for i in candidates if scores.get(i, 0.0) < weight]
+        choices = [_norm_titles[i] for i in pending]
+        for _, r, j in process.extract(q_norm, choices, scorer=scorer, limit=None, score_cutoff=cutoff):
+            i = pending[j]
+            scores[i] = max(scores.get(i, 0.0), weight * r / 100.0)
+    return scores
 
 def exact_lookup(query: str) -> Tuple[str, Dict[str, Optional[str] | bool]] | None:
     key = query.strip().lower()
     if key in _lc_index:
-        orig = _lc_index[key]
-        return (orig, manuals[orig])
+        i = _lc_index[key]
+        return (_titles[i], rec(i))
     return None
 
-def smart_search(query: str, top_n: int = 10, min_score: float = 0.52) -> List[Tuple[str, Dict[str, Optional[str] | bool], float]]:
-    scored: List[Tuple[str, Dict[str, Optional[str] | bool], float]] = []
-    for title, meta in manuals.items():
-        s = composite_score(query, title)
-        if s >= min_score:
-            scored.append((title, meta, s))
-    scored.sort(key=lambda x: x[2], reverse=True)
-    return scored[:top_n]
+def prefix_lookup(prefix: str) -> List[Tuple[str, Dict[str, Optional[str] | bool]]]:
+    """All titles starting with prefix (case-insensitive), in title order."""
+    key = prefix.strip().lower()
+    lo = bisect.bisect_left(_lc_keys, key)
+    hi = bisect.bisect_left(_lc_keys, key + "\U0010ffff", lo)
+    return [(_titles[i], rec(i)) for i in _lc_order[lo:hi]]
 
-def list_grouped_by_display_box(box_filter: Optional[str] = None) -> Dict[str, List[str]]:
+def smart_search(query: str, top_n: int = 10, min_score: float = 0.52) -> List[Tuple[str, Dict[str, Optional[str] | bool], float]]:
+    hits = _smart_search_cached(normalize(query), top_n, min_score)
+    return [(_titles[i], rec(i), s) for i, s in hits]
+
+@lru_cache(maxsize=256)
+def _smart_search_cached(q_norm: str, top_n: int, min_score: float) -> Tuple[Tuple[int, float], ...]:
+    """(title index, score) pairs for smart_search; cleared by rebuild_lc_index()."""
+    if not q_norm:
+        return ()
+    q_tokens = frozenset(q_norm.split())  # q_norm is already space-joined tokens
+    q_count = len(q_tokens)
+    marks = token_marks(q_tokens)
+    # Every title is scored: substring and partial matches need not share a
+    # whole token with the query ('10' in 'HP 10BII'), so no candidate set
+    # built from _postings is safe; the postings only supply the overlap.
+    candidates = list(range(len(_titles)))
+    if process is not None:
+        hits = batch_scores(q_norm, q_count, marks, candidates, min_score)
+    else:
+        hits = {}
+        for i in candidates:
+            s = composite_score(q_norm, q_count, _norm_titles[i], marks.get(i, 0), min_score)
+            if s >= min_score:
+                hits[i] = s
+    # -i breaks ties, so equal scores keep catalog order without sorting every hit
+    top = heapq.nlargest(top_n, hits, key=lambda i: (hits[i], -i))
+    return tuple((i, hits[i]) for i in top)
+
+def list_grouped_by_display_box(box_filter: Optional[str] = None) -> Dict[str, List[int]]:
     """
     Groups by display label used in the Box column:
       - If box is set: that BOX label
       - Else if cover=True: 'COVER'
       - Else: 'UNKNOWN'
+    Values are indices into _titles, sorted case-insensitively by title.
+    The lists are shared with the index: don't modify them.
     """
-    by_box: Dict[str, List[str]] = {}
-    for title, meta in manuals.items():
-        label = meta["box"] if meta["box"] else ("COVER" if meta["cover"] else "UNKNOWN")
-        if box_filter and (label.lower() != box_filter.lower()):
-            continue
-        by_box.setdefault(str(label), []).append(title)
-    for v in by_box.values():
-        v.sort(key=str.lower)
-    return by_box
+    if not box_filter:
+        return dict(_box_indices)
+    wanted = box_filter.lower()
+    return {label: idxs for label, idxs in _box_indices.items() if label.lower() == wanted}
 
 # ============================================================
 # Pretty printing (aligned table)
@@ -175,6 +453,10 @@ COL_BOX = 8
 COL_COVER = 5
 COL_SCORE = 6
 
+# one table row: title, box label, cover, score (already padded)
+_ROW_FMT = f"{{:<{COL_TITLE}}}  {{:<{COL_BOX}}}  {{:<{COL_COVER}}}  {{}}\n"
+_NO_SCORE = " " * COL_SCORE
+
 def _truncate(s: str, width: int) -> str:
     if len(s) <= width:
         return s
@@ -185,26 +467,20 @@ def _truncate(s: str, width: int) -> str:
 def _format_row(title: str, box: Optional[str], cover: bool, score: Optional[float]) -> str:
     # Show 'COVER' when no box but cover=True; else 'UNKNOWN'
     label = box if box else ("COVER" if cover else "UNKNOWN")
-    t = _truncate(title, COL_TITLE)
-    b = _truncate(str(label), COL_BOX)
-    c = "Yes" if cover else "No"
-    if score is None:
-        sc = " " * COL_SCORE
-    else:
-        sc = f"{score:>{COL_SCORE}.2f}"
-    return f"{t:<{COL_TITLE}}  {b:<{COL_BOX}}  {c:<{COL_COVER}}  {sc}"
+    sc = _NO_SCORE if score is None else f"{score:>{COL_SCORE}.2f}"
+    return _ROW_FMT.format(_truncate(title, COL_TITLE), _truncate(label, COL_BOX),
+                           "Yes" if cover else "No", sc)
 
-def _print_header(show_score: bool) -> None:
+def _format_header(show_score: bool) -> str:
     line = f"{'Title':<{COL_TITLE}}  {'Box':<{COL_BOX}}  {'Cover':<{COL_COVER}}"
     if show_score:
         line += f"  {'Score':>{COL_SCORE}}"
-    print(line)
-    print("-" * (COL_TITLE + 2 + COL_BOX + 2 + COL_COVER + (2 + COL_SCORE if show_score else 0)))
+    rule = "-" * (COL_TITLE + 2 + COL_BOX + 2 + COL_COVER + (2 + COL_SCORE if show_score else 0))
+    return f"{line}\n{rule}\n"
 
 def print_table(rows: List[Tuple[str, Optional[str], bool, Optional[float]]], show_score: bool) -> None:
-    _print_header(show_score)
-    for title, box, cover, score in rows:
-        print(_format_row(title, box, cover, score))
+    # build the whole table and hand it to stdout in a single write
+    sys.stdout.write(_format_header(show_score) + "".join(_format_row(*row) for row in rows))
 
 # ============================================================
 # Interactive CLI
@@ -216,6 +492,7 @@ def interactive():
     print("Commands:")
     print("  search <text>       — fuzzy/partial search (aligned table)")
     print("  exact <title>       — exact (case-insensitive, aligned row)")
+    print("  prefix <text>       — titles starting with text (case-insensitive)")
     print("  list                — list all grouped by display box (BOX 1/2/3, COVER, UNKNOWN)")
     print("  list box 1|2|3      — list a specific box (aligned table)")
     print("  list cover          — list all items that have a cover")
@@ -234,6 +511,9 @@ def interactive():
             print("Goodbye!")
             break
 
+        # every command below reads the catalog
+        _ensure_loaded()
+
         parts = raw.split(" ", 1)
         cmd = parts[0].lower()
         arg = parts[1].strip() if len(parts) > 1 else ""
@@ -301,18 +581,16 @@ def interactive():
             if arg.lower().startswith("box"):
                 box = arg.upper().strip()  # "BOX 1", "BOX 2", "BOX 3"
                 grouped = list_grouped_by_display_box(box)
-                titles = grouped.get(box, [])
-                rows = [(t, manuals[t]["box"], bool(manuals[t]["cover"]), None) for t in titles]
+                rows = [(_titles[i], _boxes[i], bool(_covers[i]), None) for i in grouped.get(box, [])]
                 if not rows:
                     print(f"No items in {box}.")
                 else:
                     print_table(rows, show_score=False)
             elif arg.lower() == "cover":
-                titles = sorted([t for t, m in manuals.items() if m["cover"]], key=str.lower)
-                if not titles:
+                if not _cover_indices:
                     print("No items with cover flag.")
                 else:
-                    rows = [(t, manuals[t]["box"], True, None) for t in titles]
+                    rows = [(_titles[i], _boxes[i], True, None) for i in _cover_indices]
                     print_table(rows, show_score=False)
             else:
                 grouped = list_grouped_by_display_box()
@@ -320,7 +598,7 @@ def interactive():
                     print("No items in catalog.")
                 for box_label in sorted(grouped.keys()):
                     print(f"\n{box_label}")
-                    rows = [(t, manuals[t]["box"], bool(manuals[t]["cover"]), None) for t in grouped[box_label]]
+                    rows = [(_titles[i], _boxes[i], bool(_covers[i]), None) for i in grouped[box_label]]
                     print_table(rows, show_score=False)
             continue
 
@@ -337,6 +615,18 @@ def interactive():
                 print("No exact (case-insensitive) match.")
             continue
 
+        # ---------- PREFIX ----------
+        if cmd == "prefix":
+            if not arg:
+                print("Usage: prefix <text>")
+                continue
+            res = prefix_lookup(arg)
+            if res:
+                print_table([(t, meta["box"], bool(meta["cover"]), None) for t, meta in res], show_score=False)
+            else:
+                print("No titles start with that text.")
+            continue
+
         # ---------- SEARCH ----------
         if cmd == "search":
             if not arg:
@@ -368,6 +658,5 @@ def interactive():
             print("No close matches found.")
 
 if __name__ == "__main__":
-    init_manuals()
     interactive()
 